@@ -0,0 +1,60 @@
+"""Measure the crawl stall removed by DriverPool, using a fake sleep-based driver factory.
+
+Each rotation in the scraper calls ``DriverPool.acquire``. Without spares every acquire
+is a cold launch; with a warm spare the launch happens in the background while the
+scraper keeps working. Run with ``python benchmarks/bench_driver_pool.py``.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from driver_pool import DriverPool  # noqa: E402
+
+
+class FakeDriver:
+    def execute_script(self, script):
+        return 1
+
+    def quit(self):
+        pass
+
+
+def run(spares: int, launch_seconds: float, work_seconds: float, rotations: int) -> dict:
+    def factory():
+        time.sleep(launch_seconds)
+        return FakeDriver()
+
+    pool = DriverPool(factory, lambda message: None, spares=spares)
+    pool.start()
+    started = time.time()
+    try:
+        for _ in range(rotations):
+            pool.acquire()
+            time.sleep(work_seconds)  # pages loaded with this session
+    finally:
+        pool.close()
+    stats = pool.stats()
+    stats['wall_seconds'] = round(time.time() - started, 2)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--launch-seconds', type=float, default=1.0)
+    parser.add_argument('--work-seconds', type=float, default=1.5)
+    parser.add_argument('--rotations', type=int, default=6)
+    args = parser.parse_args()
+
+    for label, spares in (("cold launch only", 0), ("1 warm spare", 1)):
+        stats = run(spares, args.launch_seconds, args.work_seconds, args.rotations)
+        print(f"{label:>16}: wall {stats['wall_seconds']:6.2f}s, "
+              f"avg stall {stats['avg_stall_seconds']:5.2f}s, "
+              f"warm swaps {stats['warm_swaps']}/{stats['swaps']}, "
+              f"stall saved {stats['stall_seconds_saved']:5.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,5 @@
 # Controller
-import threading
+import os
 from tkinter import filedialog
 from model import ScraperModel
 from view import ScraperView
@@ -9,19 +9,28 @@ class ScraperController:
     def __init__(self):
         self.model = ScraperModel()
         self.view = ScraperView()
+        self._running = False
+        self._run_id = 0
 
         # Bind events
         self.view.path_button.configure(command=self.browse_path)
         self.view.start_button.configure(command=self.start_scraping)
         self.view.stop_button.configure(command=self.stop_scraping)
+        self.view.pause_button.configure(command=self.toggle_pause)
+        self.view.protocol("WM_DELETE_WINDOW", self.on_closing)
 
         # Start log checker
         self.check_logs()
 
     def check_logs(self):
-        while not self.model.log_queue.empty():
-            message = self.model.log_queue.get()
+        for message in self.model.drain_logs():
             self.view.add_log(message)
+        if self._running:
+            self.update_progress(self.model.progress.value)
+            self.view.update_counters(self.model.links_found, self.model.items_saved)
+            if not self.model.is_running:
+                self._running = False
+                self._handle_completion()
         self.view.after(100, self.check_logs)
 
     def browse_path(self):
@@ -33,9 +42,6 @@ class ScraperController:
     def update_progress(self, current: float):
         self.view.update_progress(current)
 
-    def on_scraping_complete(self):
-        self.view.after(0, self._handle_completion)
-
     def _handle_completion(self):
         self.model.log("Scraping completed!")
         self.view.set_controls_state(False)
@@ -52,24 +58,52 @@ class ScraperController:
         self.model.config.output_path = self.view.path_entry.get()
         self.model.config.item_limit = int(self.view.limit_entry.get())
         self.model.config.page_limit = int(self.view.page_limit_entry.get())
+        self.model.config.listing_only = bool(self.view.listing_only_checkbox.get())
+        profile_percent = int(self.view.profile_entry.get())
+        self.model.config.profile_dir = (os.path.join(self.model.config.output_path, "profiles")
+                                         if profile_percent > 0 else "")
+        self.model.config.profile_sample_rate = profile_percent / 100
+        self.model.config.use_cprofile = bool(self.view.cprofile_checkbox.get())
 
         # Update UI state
         self.view.set_controls_state(True)
         self.view.update_progress(0)
 
-        # Start scraping in a separate thread
+        # Start scraping in a separate process
         self.model.log("Starting scraping process...")
-        thread = threading.Thread(
-            target=self.model.start_scraping,
-            args=(self.update_progress, self.on_scraping_complete)
-        )
-        thread.daemon = True
-        thread.start()
+        self.model.start_scraping()
+        self._running = True
+        self._run_id += 1
 
     def stop_scraping(self):
         self.model.log("Stopping scraping process...")
         self.model.stop_scraping()
-        self.view.set_controls_state(False)
+        self.view.stop_button.configure(state="disabled")
+        self.view.pause_button.configure(state="disabled")
+        run_id = self._run_id
+        self.view.after(self.model.stop_grace_seconds * 1000, lambda: self._force_stop(run_id))
+
+    def _force_stop(self, run_id: int):
+        if run_id == self._run_id and self.model.is_running:
+            self.model.log("Scraper did not stop in time, terminating worker process")
+            self.model.terminate()
+
+    def on_closing(self):
+        # The worker runs in its own session, so nothing else would take its browsers down
+        if self.model.is_running:
+            self.model.stop_scraping()
+            self.model.terminate()
+        self.view.on_closing()
+
+    def toggle_pause(self):
+        if self.model.is_paused:
+            self.model.log("Resuming scraping process...")
+            self.model.resume_scraping()
+            self.view.set_paused(False)
+        else:
+            self.model.log("Pausing scraping process...")
+            self.model.pause_scraping()
+            self.view.set_paused(True)
 
     def validate_inputs(self) -> bool:
         if not self.view.url_entry.get():
@@ -81,7 +115,8 @@ class ScraperController:
         try:
             limit = int(self.view.limit_entry.get())
             page_limit = int(self.view.page_limit_entry.get())
-            if limit <= 0 or page_limit <= 0:
+            profile_percent = int(self.view.profile_entry.get())
+            if limit <= 0 or page_limit <= 0 or not 0 <= profile_percent <= 100:
                 return False
         except ValueError:
             return False
@@ -0,0 +1,64 @@
+import json
+import os
+from datetime import datetime
+from typing import Callable, Dict, List
+
+
+class DeadLetterQueue:
+    """URLs that failed scraping, persisted as JSON for a deferred retry pass.
+
+    Each entry keeps the failure category, the last error and how many runs/passes it has
+    failed in. Permanent failures (removed ads, bad URLs) are kept only so later runs skip
+    them; other entries are retried until they have failed ``max_failures`` times.
+    """
+
+    def __init__(self, path: str, log_callback: Callable[[str], None], max_failures: int = 3):
+        self.path = path
+        self.log = log_callback
+        self.max_failures = max_failures
+        self.entries: Dict[str, Dict] = self._load()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.entries
+
+    def is_permanent(self, url: str) -> bool:
+        return self.entries.get(url, {}).get('category') == 'permanent'
+
+    def add(self, url: str, category: str, error: Exception):
+        entry = self.entries.setdefault(url, {'failures': 0})
+        entry.update({
+            'category': category,
+            'error_type': type(error).__name__,
+            'error_message': str(error),
+            'failures': entry['failures'] + 1,
+            'last_failed': datetime.now().isoformat(),
+        })
+        self._save()
+
+    def remove(self, url: str):
+        if self.entries.pop(url, None) is not None:
+            self._save()
+
+    def retryable(self) -> List[str]:
+        return [url for url, entry in self.entries.items()
+                if entry['category'] != 'permanent' and entry['failures'] < self.max_failures]
+
+    def _load(self) -> Dict:
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.log(f"Error loading dead-letter queue: {str(e)}")
+        return {}
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            self.log(f"Error saving dead-letter queue: {str(e)}")
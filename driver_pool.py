@@ -0,0 +1,164 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Tuple
+
+from selenium import webdriver
+
+
+class DriverPool:
+    """Keep pre-launched WebDriver sessions on standby so rotations don't wait for Chrome.
+
+    A background thread keeps ``spares`` warm drivers ready, health-checks idle ones every
+    ``health_check_interval`` seconds and replaces any idle for over ``max_idle_seconds``.
+    ``acquire`` hands out a warm spare when one is available and only cold-launches as a
+    fallback; retired drivers are quit in the background. Launch and swap timings are
+    kept so the hidden startup cost can be logged.
+    """
+
+    def __init__(self, factory: Callable[[], webdriver.Chrome],
+                 log_callback: Callable[[str], None],
+                 spares: int = 1, health_check_interval: float = 60,
+                 max_idle_seconds: float = 1800):
+        self.factory = factory
+        self.log = log_callback
+        self.spares = spares
+        self.health_check_interval = health_check_interval
+        self.max_idle_seconds = max_idle_seconds
+
+        self._idle: Deque[Tuple[webdriver.Chrome, float]] = deque()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = threading.Event()
+        self._thread = None
+        self._retiring: List[threading.Thread] = []
+
+        self._launch_times: List[float] = []
+        self._stall_times: List[float] = []
+        self._warm_swaps = 0
+        self._unhealthy = 0
+
+    def start(self):
+        """Start warming spares in the background."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._maintain, daemon=True)
+            self._thread.start()
+
+    def acquire(self) -> webdriver.Chrome:
+        """Return a ready driver, preferring a warm spare over a cold launch."""
+        started = time.time()
+        driver = None
+        with self._lock:
+            if self._idle:
+                driver, _ = self._idle.popleft()
+
+        if driver is not None and self._is_healthy(driver):
+            self._warm_swaps += 1
+        else:
+            if driver is not None:
+                self._unhealthy += 1
+                self.retire(driver)
+            driver = self._launch()
+
+        self._stall_times.append(time.time() - started)
+        self._wakeup.set()
+        return driver
+
+    def retire(self, driver: webdriver.Chrome):
+        """Quit a driver without blocking the caller."""
+        thread = threading.Thread(target=self._quit, args=(driver,), daemon=True)
+        thread.start()
+        with self._lock:
+            self._retiring = [retiring for retiring in self._retiring if retiring.is_alive()]
+            self._retiring.append(thread)
+
+    def close(self):
+        """Stop the warming thread and quit every idle and retiring driver."""
+        self._closed.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=30)
+        with self._lock:
+            idle = [driver for driver, _ in self._idle]
+            self._idle.clear()
+        for driver in idle:
+            self._quit(driver)
+        with self._lock:
+            retiring, self._retiring = self._retiring, []
+        for thread in retiring:
+            thread.join(timeout=10)
+
+    def stats(self) -> Dict:
+        """Startup-cost measurements: cold launch time vs. the stall seen by the scraper."""
+        avg_launch = sum(self._launch_times) / len(self._launch_times) if self._launch_times else 0.0
+        avg_stall = sum(self._stall_times) / len(self._stall_times) if self._stall_times else 0.0
+        return {
+            'swaps': len(self._stall_times),
+            'warm_swaps': self._warm_swaps,
+            'unhealthy_spares': self._unhealthy,
+            'avg_launch_seconds': round(avg_launch, 2),
+            'avg_stall_seconds': round(avg_stall, 2),
+            'stall_seconds_saved': round(max(0.0, avg_launch * len(self._stall_times) - sum(self._stall_times)), 1),
+        }
+
+    def _launch(self) -> webdriver.Chrome:
+        started = time.time()
+        driver = self.factory()
+        self._launch_times.append(time.time() - started)
+        return driver
+
+    def _maintain(self):
+        while not self._closed.is_set():
+            try:
+                self._check_idle()
+                while not self._closed.is_set() and len(self._idle) < self.spares:
+                    driver = self._launch()
+                    with self._lock:
+                        # close() may have drained the pool while this launch was running
+                        closed = self._closed.is_set()
+                        if not closed:
+                            self._idle.append((driver, time.time()))
+                    if closed:
+                        self._quit(driver)
+                        break
+                    self.log("Standby WebDriver session ready")
+            except Exception as e:
+                self.log(f"Failed to warm standby WebDriver: {str(e)}")
+                self._closed.wait(self.health_check_interval)
+
+            self._wakeup.wait(self.health_check_interval)
+            self._wakeup.clear()
+
+    def _check_idle(self):
+        """Replace idle spares that no longer respond or have sat idle too long."""
+        with self._lock:
+            idle = list(self._idle)
+        for entry in idle:
+            driver, launched_at = entry
+            expired = time.time() - launched_at > self.max_idle_seconds
+            if not expired and self._is_healthy(driver):
+                continue
+            with self._lock:
+                if entry not in self._idle:
+                    continue
+                self._idle.remove(entry)
+            if expired:
+                self.log("Standby WebDriver session expired, replacing")
+            else:
+                self._unhealthy += 1
+                self.log("Standby WebDriver session failed health check, replacing")
+            self.retire(driver)
+
+    @staticmethod
+    def _is_healthy(driver: webdriver.Chrome) -> bool:
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver: webdriver.Chrome):
+        try:
+            driver.quit()
+        except:
+            pass
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
-from typing import Callable, List
-import threading
+from typing import List
+import multiprocessing
 import os
+import signal
+import subprocess
 from datetime import datetime
-from queue import Queue
+from queue import Empty, Queue
 from service import OlxScraper
 
 
@@ -15,42 +17,153 @@ class ScraperConfig:
     output_path: str = ""
     item_limit: int = 0
     page_limit: int = 100
+    listing_only: bool = False
+    page_load_timeout: int = 60
+    profile_dir: str = ""
+    profile_sample_rate: float = 1.0
+    use_cprofile: bool = False
     current_progress: int = 0
 
+
+def _format_log(message: str) -> str:
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    return f"[{timestamp}] {message}"
+
+
+def run_scraper_process(config: ScraperConfig, log_queue, progress, counters, stop_flag, pause_flag):
+    """Worker process entry point: run the scraper and report through shared memory and the log queue."""
+    if hasattr(os, 'setsid'):
+        # Own process group, so a forced stop can take chromedriver and Chrome down with us
+        os.setsid()
+    scraper = None
+
+    def log(message: str):
+        log_queue.put(_format_log(message))
+
+    def update_progress(value: float):
+        progress.value = value
+        if scraper:
+            counters[0] = scraper.total_items_found
+            counters[1] = scraper.items_saved
+
+    try:
+        scraper = OlxScraper(
+            base_url=config.url,
+            output_file=os.path.join(config.output_path, f"{config.output_name}.json"),
+            item_limit=config.item_limit,
+            progress_callback=update_progress,
+            stop_flag=stop_flag,
+            log_callback=log,
+            page_limit=config.page_limit,
+            listing_only=config.listing_only,
+            pause_flag=pause_flag,
+            page_load_timeout=config.page_load_timeout,
+            profile_dir=config.profile_dir or None,
+            profile_sample_rate=config.profile_sample_rate,
+            use_cprofile=config.use_cprofile
+        )
+        scraper.run()
+    except Exception as e:
+        log(f"Error during scraping: {str(e)}")
+
+
+def _kill_process_tree(pid: int):
+    """Kill a worker process together with the browsers it launched."""
+    if os.name == 'nt':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
 class ScraperModel:
+    """Runs the scraper in a worker process so the GUI never shares a GIL with it.
+
+    Logs come back over a multiprocessing queue created per run, progress and counters are
+    shared-memory values the GUI polls, and stop/pause are process-shared events the
+    scraper's waits honour.
+    """
+
+    # Time allowed after a stop for an in-flight page load to time out and drivers to quit
+    DRIVER_QUIT_GRACE = 15
+
     def __init__(self):
         self.config = ScraperConfig()
-        self.is_running = False
-        self.stop_flag = threading.Event()
-        self._scraper = None
-        self.log_queue = Queue()
-        self.completion_callback = None
+        self.stop_flag = multiprocessing.Event()
+        self.pause_flag = multiprocessing.Event()
+        self.log_queue = None
+        self._local_logs = Queue()
+        self.progress = multiprocessing.RawValue('d', 0.0)
+        self.counters = multiprocessing.RawArray('i', 2)  # links found, items saved
+        self._process = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    @property
+    def is_paused(self) -> bool:
+        return self.pause_flag.is_set()
+
+    @property
+    def stop_grace_seconds(self) -> int:
+        return self.config.page_load_timeout + self.DRIVER_QUIT_GRACE
+
+    @property
+    def links_found(self) -> int:
+        return self.counters[0]
+
+    @property
+    def items_saved(self) -> int:
+        return self.counters[1]
 
     def log(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_queue.put(f"[{timestamp}] {message}")
+        self._local_logs.put(_format_log(message))
+
+    def drain_logs(self) -> List[str]:
+        messages = []
+        for queue in (self._local_logs, self.log_queue):
+            while queue is not None:
+                try:
+                    messages.append(queue.get_nowait())
+                except Empty:
+                    break
+        return messages
 
-    def start_scraping(self, progress_callback: Callable[[float], None], completion_callback: Callable[[], None]):
+    def start_scraping(self):
         self.stop_flag.clear()
-        self.is_running = True
-        self.completion_callback = completion_callback
-        try:
-            self._scraper = OlxScraper(
-                base_url=self.config.url,
-                output_file=os.path.join(self.config.output_path, f"{self.config.output_name}.json"),
-                item_limit=self.config.item_limit,
-                progress_callback=progress_callback,
-                stop_flag=self.stop_flag,
-                log_callback=self.log,
-                page_limit=self.config.page_limit  # Added this line
-            )
-            self._scraper.run()
-        except Exception as e:
-            self.log(f"Error during scraping: {str(e)}")
-        finally:
-            self.is_running = False
-            if self.completion_callback:
-                self.completion_callback()
+        self.pause_flag.clear()
+        self.progress.value = 0.0
+        self.counters[0] = self.counters[1] = 0
+        self.log_queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=run_scraper_process,
+            args=(self.config, self.log_queue, self.progress, self.counters,
+                  self.stop_flag, self.pause_flag),
+            daemon=True
+        )
+        self._process.start()
 
     def stop_scraping(self):
-        self.stop_flag.set()
\ No newline at end of file
+        self.stop_flag.set()
+        self.pause_flag.clear()
+
+    def pause_scraping(self):
+        self.pause_flag.set()
+
+    def resume_scraping(self):
+        self.pause_flag.clear()
+
+    def terminate(self):
+        """Kill the worker and its browsers if it did not exit after a stop request (e.g. a hung Chrome)."""
+        if self.is_running:
+            _kill_process_tree(self._process.pid)
+            self._process.join(timeout=5)
+            if self._process.is_alive():
+                self._process.kill()
+                self._process.join(timeout=5)
+            # A queue whose writer was killed mid-put may be corrupt; never read it again
+            self.log_queue = None
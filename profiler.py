@@ -0,0 +1,195 @@
+import cProfile
+import heapq
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+
+class TraceRecorder:
+    """Opt-in per-URL tracing for scraper runs.
+
+    Spans (``driver.get``, ``wait_for_element``, sleeps, saves...) are recorded as Chrome
+    trace events, loadable in chrome://tracing, Perfetto or speedscope. Only a
+    ``sample_rate`` fraction of URLs is traced, so the recorder can stay on for part of
+    production traffic; ``use_cprofile`` additionally wraps the run in cProfile, which
+    costs noticeably more and is meant for one-off investigations.
+
+    Events are streamed to disk after every traced ad (and whenever ``flush_every`` are
+    buffered) in the JSON array trace format, whose closing bracket is optional, so memory
+    stays bounded and a killed run still leaves a loadable trace. Only the ``slowest``
+    ads are kept for the report, which is rewritten on each flush.
+    """
+
+    def __init__(self, output_dir: Optional[str], log_callback: Callable[[str], None],
+                 sample_rate: float = 1.0, use_cprofile: bool = False, slowest: int = 20,
+                 flush_every: int = 500):
+        self.output_dir = output_dir
+        self.enabled = bool(output_dir)
+        self.log = log_callback
+        self.sample_rate = sample_rate
+        self.use_cprofile = use_cprofile
+        self.slowest = slowest
+        self.flush_every = flush_every
+
+        self._lock = threading.Lock()
+        self._events: List[Dict] = []
+        self._slowest: List = []  # min-heap of (total, seq, timing)
+        self._sequence = itertools.count()
+        self._traced = 0
+        self._current: Optional[Dict] = None
+        self._sampled = True
+        self._pid = os.getpid()
+        self._origin = time.perf_counter()
+        self._trace_file = None
+        self._report_path = None
+
+    @contextmanager
+    def span(self, name: str, **args):
+        """Record a timed span, attributed to the URL currently being traced."""
+        if not self.enabled or not self._sampled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            finished = time.perf_counter()
+            self._add_event(name, started, finished, args)
+            if self._current is not None and threading.current_thread() is threading.main_thread():
+                spans = self._current['spans']
+                spans[name] = spans.get(name, 0.0) + finished - started
+
+    @contextmanager
+    def url(self, url: str):
+        """Trace everything done for one ad URL, if it falls in the sample."""
+        if not self.enabled:
+            yield
+            return
+        self._sampled = random.random() < self.sample_rate
+        if not self._sampled:
+            try:
+                yield
+            finally:
+                self._sampled = True
+            return
+
+        self._current = {'url': url, 'spans': {}}
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            finished = time.perf_counter()
+            self._add_event('ad', started, finished, {'url': url})
+            self._current['total'] = finished - started
+            self._keep_if_slow(self._current)
+            self._current = None
+            self._flush()
+            self._write_slowest_report()
+
+    @contextmanager
+    def session(self):
+        """Wrap a whole run: optionally under cProfile, streaming the trace as it goes."""
+        if not self.enabled:
+            yield
+            return
+        stamp = self._open_outputs()
+        profile = cProfile.Profile() if self.use_cprofile else None
+        if profile:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile:
+                profile.disable()
+            self._close_outputs(profile, stamp)
+
+    def _add_event(self, name: str, started: float, finished: float, args: Dict):
+        event = {
+            'name': name,
+            'cat': 'scraper',
+            'ph': 'X',
+            'ts': round((started - self._origin) * 1e6),
+            'dur': round((finished - started) * 1e6),
+            'pid': self._pid,
+            'tid': threading.get_ident(),
+            'args': {key: str(value) for key, value in args.items()},
+        }
+        with self._lock:
+            self._events.append(event)
+            full = len(self._events) >= self.flush_every
+        if full:
+            self._flush()
+
+    def _keep_if_slow(self, timing: Dict):
+        self._traced += 1
+        heapq.heappush(self._slowest, (timing['total'], next(self._sequence), timing))
+        if len(self._slowest) > self.slowest:
+            heapq.heappop(self._slowest)
+
+    def _open_outputs(self) -> Optional[str]:
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self._trace_file = open(os.path.join(self.output_dir, f"trace_{stamp}.json"),
+                                    'w', encoding='utf-8')
+            self._trace_file.write('[\n')
+            self._report_path = os.path.join(self.output_dir, f"slowest_ads_{stamp}.txt")
+            return stamp
+        except Exception as e:
+            self.log(f"Error opening profiling output: {str(e)}")
+            self.enabled = False
+            return None
+
+    def _flush(self):
+        """Append buffered events to the trace file."""
+        with self._lock:
+            events, self._events = self._events, []
+            if self._trace_file is None or not events:
+                return
+            try:
+                self._trace_file.write(''.join(json.dumps(event) + ',\n' for event in events))
+                self._trace_file.flush()
+            except Exception as e:
+                self.log(f"Error writing trace events: {str(e)}")
+
+    def _close_outputs(self, profile: Optional[cProfile.Profile], stamp: Optional[str]):
+        try:
+            self._flush()
+            with self._lock:
+                if self._trace_file is not None:
+                    # Closing metadata event, so the array ends without a trailing comma
+                    self._trace_file.write(json.dumps({'name': 'trace_end', 'ph': 'M', 'pid': self._pid,
+                                                       'args': {}}) + '\n]\n')
+                    self._trace_file.close()
+                    self._trace_file = None
+            self._write_slowest_report()
+            if profile and stamp:
+                profile.dump_stats(os.path.join(self.output_dir, f"profile_{stamp}.prof"))
+            self.log(f"Profiling reports saved to {self.output_dir}")
+        except Exception as e:
+            self.log(f"Error saving profiling reports: {str(e)}")
+
+    def _write_slowest_report(self):
+        if not self._report_path:
+            return
+        try:
+            with open(self._report_path, 'w', encoding='utf-8') as f:
+                f.write(self._slowest_report())
+        except Exception as e:
+            self.log(f"Error writing slowest ads report: {str(e)}")
+
+    def _slowest_report(self) -> str:
+        timings = [timing for _, _, timing in sorted(self._slowest, reverse=True)]
+        lines = [f"Slowest {len(timings)} of {self._traced} traced ads", ""]
+        for rank, timing in enumerate(timings, 1):
+            lines.append(f"{rank:>3}. {timing['total']:8.2f}s  {timing['url']}")
+            # Span times are inclusive, so nested spans also count towards their parent
+            for name, seconds in sorted(timing['spans'].items(), key=lambda span: span[1], reverse=True):
+                lines.append(f"       {seconds:8.2f}s  {name}")
+        return "\n".join(lines) + "\n"
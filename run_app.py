@@ -1,5 +1,7 @@
+import multiprocessing
 from controller import ScraperController
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     controller = ScraperController()
     controller.run()
\ No newline at end of file
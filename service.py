@@ -1,10 +1,18 @@
 import os
+import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.common.exceptions import (TimeoutException, WebDriverException, InvalidArgumentException,
+                                        InvalidSessionIdException, NoSuchWindowException)
 from selenium.webdriver.common.action_chains import ActionChains
 from dataclasses import asdict, dataclass
 from typing import List, Optional, Callable, Dict
@@ -13,6 +21,10 @@ import time
 import random
 import logging
 from datetime import datetime
+from throttle import AdaptiveRateController
+from driver_pool import DriverPool
+from profiler import TraceRecorder
+from dead_letters import DeadLetterQueue
 
 
 @dataclass
@@ -29,28 +41,128 @@ class ProductDetails:
     post_date: str
 
 
+# Failure categories used to pick a retry policy
+PERMANENT = 'permanent'
+TRANSIENT = 'transient'
+SESSION_FATAL = 'session'
+
+
+class ScrapeFailure(Exception):
+    """A scraping failure whose category is already known."""
+
+    def __init__(self, message: str, category: str):
+        super().__init__(message)
+        self.category = category
+
+
+class DriverUnavailable(Exception):
+    """No WebDriver session could be started; the run cannot continue."""
+
+
+class _ListingPageParser(HTMLParser):
+    """Collect the first product link inside every listing card of a raw HTML page.
+
+    Also keeps the page's visible text (title and body, without ``<script>``/``<style>``
+    contents), so block detection sees what the browser path's ``innerText`` would.
+    """
+
+    HIDDEN_TAGS = ('script', 'style', 'template')
+
+    def __init__(self, base_url: str, max_text: int = 5000):
+        super().__init__()
+        self.base_url = base_url
+        self.max_text = max_text
+        self.links: List[str] = []
+        self._text: List[str] = []
+        self._text_length = 0
+        self._in_card = False
+        self._hidden = 0
+
+    @property
+    def text(self) -> str:
+        return ' '.join(self._text)[:self.max_text]
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.HIDDEN_TAGS:
+            self._hidden += 1
+            return
+        attrs = dict(attrs)
+        if attrs.get('data-cy') == 'l-card':
+            self._in_card = True
+        elif self._in_card and tag == 'a' and attrs.get('href'):
+            self.links.append(urljoin(self.base_url, attrs['href']))
+            self._in_card = False
+
+    def handle_endtag(self, tag):
+        if tag in self.HIDDEN_TAGS and self._hidden:
+            self._hidden -= 1
+
+    def handle_data(self, data):
+        if self._hidden or self._text_length >= self.max_text:
+            return
+        if data := data.strip():
+            self._text.append(data)
+            self._text_length += len(data) + 1
+
+
 class OlxScraper:
+    STATE_BLOB_PATTERN = re.compile(r'window\.__PRERENDERED_STATE__\s*=\s*("(?:[^"\\]|\\.)*")')
+
     def __init__(self, base_url: str, output_file: str, item_limit: int,
                  progress_callback: Callable[[float], None],
                  stop_flag: threading.Event,
                  log_callback: Callable[[str], None],
-                 page_limit: int = 100):
+                 page_limit: int = 100,
+                 listing_only: bool = False,
+                 pause_flag: Optional[threading.Event] = None,
+                 page_load_timeout: int = 60,
+                 profile_dir: Optional[str] = None,
+                 profile_sample_rate: float = 1.0,
+                 use_cprofile: bool = False):
         self.base_url = base_url
         self.output_file = output_file
         self.item_limit = item_limit
         self.progress_callback = progress_callback
         self.stop_flag = stop_flag
+        self.pause_flag = pause_flag
         self.log = log_callback
         self.page_limit = page_limit
+        self.listing_only = listing_only
         self.products = self._load_existing_products()
+        self.listing_ads: Dict[str, ProductDetails] = {}
+        self.dead_letters = DeadLetterQueue(f"{os.path.splitext(output_file)[0]}.failed.json", self.log)
         self.driver = None
         self.total_items_found = 0
+        self.items_saved = 0
+        self.last_response_status = 0
 
         # Enhanced configuration
         self.max_retries = 3
         self.retry_delay = 5
+        self.session_markers = [
+            "invalid session",
+            "session not created",
+            "no such session",
+            "chrome not reachable",
+            "disconnected",
+            "target window already closed"
+        ]
+        self.max_parallel_pages = 8
+        self.http_timeout = 15
+        self.page_load_timeout = page_load_timeout
+        self.rate_controller = AdaptiveRateController(max_concurrency=self.max_parallel_pages)
+        self.captcha_indicators = [
+            "captcha",
+            "security check",
+            "verify you're human"
+        ]
         self.session_duration = random.randint(25, 35)  # minutes
+        self.session_page_limit = random.randint(40, 60)  # pages
         self.session_start_time = None
+        self.session_page_count = 0
+        self.driver_pool = DriverPool(self._create_driver, self.log, spares=1)
+        self.tracer = TraceRecorder(profile_dir, self.log, sample_rate=profile_sample_rate,
+                                    use_cprofile=use_cprofile)
 
         # Randomization settings
         self.delays = {
@@ -79,28 +191,115 @@ class OlxScraper:
         options.add_argument(f'user-agent={random.choice(user_agents)}')
         return options
 
+    def _create_driver(self) -> webdriver.Chrome:
+        driver = webdriver.Chrome(options=self._setup_chrome_options())
+        driver.set_page_load_timeout(self.page_load_timeout)
+        return driver
+
     def _initialize_driver(self):
-        """Initialize or reinitialize the WebDriver with error handling."""
-        try:
-            if self.driver:
-                self.driver.quit()
-        except:
-            pass
+        """Swap in a fresh WebDriver session from the standby pool."""
+        if self.driver:
+            self.driver_pool.retire(self.driver)
+            self.driver = None
 
         try:
-            self.driver = webdriver.Chrome(options=self._setup_chrome_options())
+            self.driver = self.driver_pool.acquire()
             self.session_start_time = time.time()
+            self.session_page_count = 0
             self.log("New WebDriver session initialized")
         except Exception as e:
             self.log(f"Failed to initialize WebDriver: {str(e)}")
-            raise
+            raise DriverUnavailable(f"Failed to initialize WebDriver: {str(e)}") from e
 
     def _should_refresh_session(self) -> bool:
-        """Check if the current session should be refreshed."""
+        """Check if the current session should be refreshed by age or pages loaded."""
         if not self.session_start_time:
             return True
         elapsed_minutes = (time.time() - self.session_start_time) / 60
-        return elapsed_minutes >= self.session_duration
+        return (elapsed_minutes >= self.session_duration or
+                self.session_page_count >= self.session_page_limit)
+
+    def _pause(self, kind: str):
+        """Sleep for a randomized, controller-scaled delay; returns early when stopped."""
+        self._wait_if_paused()
+        with self.tracer.span('sleep', kind=kind):
+            self.stop_flag.wait(self.rate_controller.delay(self.delays[kind]))
+
+    def _wait_if_paused(self):
+        """Block while the pause flag is set, waking promptly on stop."""
+        if not self.pause_flag or not self.pause_flag.is_set():
+            return
+        self.log("Scraping paused")
+        while self.pause_flag.is_set() and not self.stop_flag.wait(0.2):
+            pass
+        if not self.stop_flag.is_set():
+            self.log("Scraping resumed")
+
+    def _navigate(self, url: str, expect_cards: bool = False) -> Optional[str]:
+        """Load a URL in the browser and report its health to the rate controller.
+
+        Returns the block signal if the response looks blocked, otherwise None.
+        """
+        if self.driver is None:
+            raise DriverUnavailable("No WebDriver session available")
+        started = time.time()
+        with self.tracer.span('driver.get', url=url):
+            self.driver.get(url)
+        latency = time.time() - started
+        self.session_page_count += 1
+        self._pause('page_load')
+
+        signal = self._detect_block(expect_cards)
+        if signal:
+            self._handle_block(signal)
+        else:
+            self.rate_controller.record_success(latency)
+        return signal
+
+    def _detect_block(self, expect_cards: bool = False) -> Optional[str]:
+        """Classify the current page as blocked (CAPTCHA, 403/429, empty listing) or healthy."""
+        try:
+            state = self.driver.execute_script("""
+                const nav = performance.getEntriesByType('navigation')[0];
+                return {
+                    status: nav && nav.responseStatus ? nav.responseStatus : 0,
+                    text: (document.title + ' ' + (document.body ? document.body.innerText : '')).slice(0, 5000),
+                    cards: document.querySelectorAll("[data-cy='l-card']").length
+                };
+            """)
+        except Exception as e:
+            self.log(f"Error checking page health: {str(e)}")
+            self.last_response_status = 0
+            return None
+        self.last_response_status = state['status']
+        return self._classify_response(state['status'], state['text'], state['cards'], expect_cards)
+
+    def _classify_response(self, status: int, text: str, cards: int, expect_cards: bool) -> Optional[str]:
+        if status == 403:
+            return 'forbidden'
+        if status == 429:
+            return 'too_many_requests'
+        if any(indicator in text.lower() for indicator in self.captcha_indicators):
+            return 'captcha'
+        if expect_cards and not cards:
+            return 'empty'
+        return None
+
+    def _handle_block(self, signal: str):
+        """Back off after a block signal, rotating the browser session on hard blocks."""
+        if self.rate_controller.record_block(signal):
+            self._cool_down_and_rotate(signal)
+        else:
+            self.log(f"Degraded response ({signal}), slowing down")
+        self.log(f"Rate controller: {self.rate_controller.snapshot()}")
+
+    def _cool_down_and_rotate(self, signal: Optional[str]):
+        """Wait out the controller's cool-down, then start a fresh browser session."""
+        self.log(f"Block detected ({signal}), cooling down for "
+                 f"{self.rate_controller.cooldown_remaining():.0f}s and rotating session")
+        if self.rate_controller.wait_for_cooldown(self.stop_flag):
+            self._initialize_driver()
+            self.rate_controller.record_rotation()
 
     def _simulate_human_behavior(self):
         """Simulate realistic human browsing behavior with safer mouse movements."""
@@ -108,7 +307,7 @@ class OlxScraper:
             # Random scrolling
             scroll_amount = random.randint(100, 500)
             self.driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-            time.sleep(random.uniform(0.5, 1.5))
+            self._pause('scroll')
 
             # Get actual viewport size for safe mouse movements
             viewport_width = self.driver.execute_script("return window.innerWidth;")
@@ -124,7 +323,7 @@ class OlxScraper:
                 try:
                     actions.move_by_offset(x, y).perform()
                     actions.reset_actions()  # Reset action chains after each movement
-                    time.sleep(random.uniform(0.1, 0.3))
+                    self._pause('mouse_move')
                 except:
                     # If movement fails, reset mouse position to (0,0) and try again
                     actions.move_to_element(self.driver.find_element(By.TAG_NAME, "body"))
@@ -138,14 +337,17 @@ class OlxScraper:
 
     def wait_for_element(self, selector: str, by: By = By.CSS_SELECTOR,
                          timeout: int = 20, retries: int = 2) -> Optional[webdriver.remote.webelement.WebElement]:
-        """Enhanced wait for element with retries and error handling."""
+        """Enhanced wait for element with retries and error handling; gives up early when stopped."""
+        present = EC.presence_of_element_located((by, selector))
         for attempt in range(retries):
             try:
-                return WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((by, selector))
-                )
+                with self.tracer.span('wait_for_element', selector=selector, timeout=timeout):
+                    element = WebDriverWait(self.driver, timeout).until(
+                        lambda driver: self.stop_flag.is_set() or present(driver)
+                    )
+                return None if self.stop_flag.is_set() else element
             except TimeoutException:
-                if attempt < retries - 1:
+                if attempt < retries - 1 and not self.stop_flag.is_set():
                     self.log(f"Timeout waiting for {selector}, retrying...")
                     self._simulate_human_behavior()
                 else:
@@ -156,7 +358,20 @@ class OlxScraper:
                 return None
 
     def get_product_links_from_page(self) -> List[str]:
-        """Get product links from the current page with enhanced error handling."""
+        """Get product links from the current page, preferring the embedded state blob."""
+        try:
+            raw_state = self.driver.execute_script("return window.__PRERENDERED_STATE__ || null;")
+            if raw_state and (ads := self._listing_ads_from_state(raw_state)):
+                links = self._remember_listing_ads(ads, self.driver.current_url)
+                self.log(f"Found {len(links)} product links in page state")
+                return links
+        except Exception as e:
+            self.log(f"Embedded listing state unavailable: {str(e)}")
+
+        return self._get_product_links_from_cards()
+
+    def _get_product_links_from_cards(self) -> List[str]:
+        """Scroll the listing and collect product links from the rendered cards."""
         links = []
         try:
             if self.wait_for_element("[data-cy='l-card']"):
@@ -168,7 +383,7 @@ class OlxScraper:
                 while current_scroll < page_height:
                     self.driver.execute_script(f"window.scrollTo(0, {current_scroll});")
                     current_scroll += viewport_height // 2
-                    time.sleep(random.uniform(*self.delays['scroll']))
+                    self._pause('scroll')
 
                 cards = self.driver.find_elements(By.CSS_SELECTOR, "[data-cy='l-card']")
                 links = [card.find_element(By.CSS_SELECTOR, "a").get_attribute('href')
@@ -181,6 +396,64 @@ class OlxScraper:
 
         return links
 
+    def _listing_ads_from_state(self, raw_state) -> List[Dict]:
+        """Pull the ad list out of the ``__PRERENDERED_STATE__`` blob (JSON string or object)."""
+        try:
+            state = json.loads(raw_state) if isinstance(raw_state, str) else raw_state
+            ads = state.get('listing', {}).get('listing', {}).get('ads', [])
+            return [ad for ad in ads if isinstance(ad, dict) and ad.get('id') and ad.get('url')]
+        except (ValueError, AttributeError) as e:
+            self.log(f"Error parsing embedded listing state: {str(e)}")
+            return []
+
+    def _listing_ads_from_html(self, html: str) -> List[Dict]:
+        """Locate and decode the state blob in raw listing HTML."""
+        match = self.STATE_BLOB_PATTERN.search(html)
+        if not match:
+            return []
+        try:
+            return self._listing_ads_from_state(json.loads(match.group(1)))
+        except ValueError as e:
+            self.log(f"Error decoding embedded listing state: {str(e)}")
+            return []
+
+    def _remember_listing_ads(self, ads: List[Dict], page_url: str) -> List[str]:
+        """Keep listing-level details for each ad and return their links in page order."""
+        links = []
+        for ad in ads:
+            link = urljoin(page_url, ad['url'])
+            self.listing_ads[self._normalize_link(link)] = self._listing_product(ad)
+            links.append(link)
+        return links
+
+    @staticmethod
+    def _listing_product(ad: Dict) -> ProductDetails:
+        """Build ProductDetails from the fields available on a listing page."""
+        price = ad.get('price') or {}
+        regular_price = price.get('regularPrice') or {}
+        location = ad.get('location') or {}
+        user = ad.get('user') or {}
+        description = re.sub(r'<br\s*/?>', '\n', ad.get('description') or '')
+        images = [photo if isinstance(photo, str) else photo.get('link', '')
+                  for photo in ad.get('photos') or []]
+
+        return ProductDetails(
+            id=str(ad['id']),
+            title=ad.get('title') or '',
+            price=price.get('displayValue') or
+                  ' '.join(str(part) for part in (regular_price.get('value'),
+                                                  regular_price.get('currencyCode')) if part),
+            description=unescape(re.sub(r'<[^>]+>', '', description)).strip(),
+            images=[image.replace('{width}', '1000').replace('{height}', '700')
+                    for image in images if image],
+            location=', '.join(part for part in (location.get('cityName'),
+                                                 location.get('districtName')) if part),
+            seller_name=user.get('name') or '',
+            seller_since=user.get('created') or '',
+            last_seen=user.get('lastSeen') or '',
+            post_date=ad.get('createdTime') or ''
+        )
+
     def has_next_page(self) -> bool:
         """Check for next page with improved reliability."""
         try:
@@ -189,6 +462,97 @@ class OlxScraper:
         except Exception:
             return False
 
+    def get_total_pages(self) -> int:
+        """Read the total page count from the pagination block of the current page."""
+        try:
+            items = self.driver.find_elements(By.CSS_SELECTOR, "[data-testid='pagination-list-item']")
+            numbers = [int(text) for item in items if (text := item.text.strip()).isdigit()]
+            return max(numbers) if numbers else 1
+        except Exception as e:
+            self.log(f"Error reading page count: {str(e)}")
+            return 1
+
+    def _build_page_url(self, page: int) -> str:
+        """Build the listing URL for the given page, keeping any existing query filters."""
+        parts = urlsplit(self.base_url)
+        query = [(key, value) for key, value in parse_qsl(parts.query) if key != 'page']
+        if page > 1:
+            query.append(('page', str(page)))
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    @staticmethod
+    def _normalize_link(link: str) -> str:
+        """Strip tracking query/fragment so promoted ads repeated across pages compare equal."""
+        return urlunsplit(urlsplit(link)._replace(query='', fragment=''))
+
+    def _create_http_session(self) -> requests.Session:
+        """Create an HTTP session sharing the browser's cookies and user agent."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=self.max_parallel_pages)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        try:
+            session.headers['User-Agent'] = self.driver.execute_script("return navigator.userAgent;")
+            for cookie in self.driver.get_cookies():
+                session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+        except Exception as e:
+            self.log(f"Could not copy browser session to HTTP client: {str(e)}")
+        return session
+
+    def _fetch_listing_page(self, session: requests.Session, page: int) -> Optional[List[str]]:
+        """Fetch a listing page over HTTP and extract its product links.
+
+        Returns None when the page could not be fetched, so the caller can fall back to the browser.
+        """
+        if self.stop_flag.is_set():
+            return []
+        url = self._build_page_url(page)
+        try:
+            self._pause('scroll')
+            with self.tracer.span('http.get', url=url):
+                response = session.get(url, timeout=self.http_timeout)
+        except requests.RequestException as e:
+            self.log(f"HTTP fetch failed for page {page}: {str(e)}")
+            return None
+
+        parser = _ListingPageParser(url)
+        parser.feed(response.text)
+        if ads := self._listing_ads_from_html(response.text):
+            links = self._remember_listing_ads(ads, url)
+        else:
+            links = parser.links
+        # Visible text only: script tags (e.g. a reCAPTCHA loader) must not read as a block
+        signal = self._classify_response(response.status_code, parser.text,
+                                         len(links), expect_cards=True)
+        if signal:
+            self.rate_controller.record_block(signal)
+            self.log(f"Page {page} looks blocked ({signal})")
+            return None
+        if not response.ok:
+            self.log(f"HTTP fetch failed for page {page}: status {response.status_code}")
+            return None
+
+        self.rate_controller.record_success(response.elapsed.total_seconds())
+        return links
+
+    def _load_listing_page_in_browser(self, page: int) -> List[str]:
+        """Load a listing page through the WebDriver and extract its product links.
+
+        Hard blocks and WebDriver errors are retried up to ``max_retries`` times.
+        """
+        for attempt in range(self.max_retries):
+            if self.stop_flag.is_set():
+                return []
+            try:
+                signal = self._navigate(self._build_page_url(page), expect_cards=True)
+                if signal not in AdaptiveRateController.HARD_SIGNALS:
+                    return self.get_product_links_from_page()
+            except WebDriverException as e:
+                self._handle_webdriver_error(e, f"listing page {page}")
+                if attempt < self.max_retries - 1:
+                    self.stop_flag.wait(self.retry_delay)
+        return []
+
     def get_location(self) -> str:
         """Enhanced location extraction with multiple selectors."""
         location_selectors = [
@@ -219,52 +583,87 @@ class OlxScraper:
 
         return images
 
-    def get_product_details(self, url: str) -> Optional[ProductDetails]:
-        """Enhanced product details extraction with retry logic."""
-        for attempt in range(self.max_retries):
-            try:
-                self.driver.get(url)
-                time.sleep(random.uniform(*self.delays['page_load']))
-                self._simulate_human_behavior()
+    def get_product_details(self, url: str,
+                            listing: Optional[ProductDetails] = None) -> Optional[ProductDetails]:
+        """Enhanced product details extraction with classified retries.
 
-                # Extract product ID
-                id_elem = self.wait_for_element("span.css-12hdxwj")
-                product_id = id_elem.text.replace('ID: ', '') if id_elem else url.split('ID')[-1].split('.')[0]
+        Fields missing from the ad page are filled from the listing-level ``listing`` details.
+        URLs that still fail are recorded in the dead-letter queue; a missing driver aborts
+        the run instead.
+        """
+        try:
+            details = self._retry_with_backoff(lambda: self._extract_product_details(url, listing),
+                                               context=url)
+        except DriverUnavailable:
+            raise
+        except Exception as e:
+            if self.stop_flag.is_set():
+                return None
+            category = self._classify_failure(e)
+            self.log(f"Giving up on {url} ({category} failure): {str(e)}")
+            self.dead_letters.add(url, category, e)
+            return None
 
-                if product_id in self.products:
-                    self.log(f"Product {product_id} already exists, skipping...")
-                    return None
+        # None after a stop means the page was abandoned, not that the ad is already saved
+        if details is not None or not self.stop_flag.is_set():
+            self.dead_letters.remove(url)
+        return details
+
+    def _extract_product_details(self, url: str,
+                                 listing: Optional[ProductDetails]) -> Optional[ProductDetails]:
+        """Open an ad page and extract its details; returns None if the product is already saved."""
+        if urlsplit(url).scheme not in ('http', 'https'):
+            raise ScrapeFailure(f"Not a valid ad URL: {url}", PERMANENT)
+
+        if (signal := self._navigate(url)) in AdaptiveRateController.HARD_SIGNALS:
+            raise ScrapeFailure(f"Blocked ({signal})", TRANSIENT)
+        self._check_ad_available(url)
+        self._simulate_human_behavior()
+
+        # Extract product ID
+        id_elem = self.wait_for_element("span.css-12hdxwj")
+        if id_elem:
+            product_id = id_elem.text.replace('ID: ', '')
+        elif listing:
+            product_id = listing.id
+        else:
+            product_id = url.split('ID')[-1].split('.')[0]
 
-                # Get all elements with improved error handling
-                details = ProductDetails(
-                    id=product_id,
-                    title=self._get_element_text("h4.css-1kc83jo"),
-                    price=self._get_element_text("h3.css-90xrc0"),
-                    description=self._get_element_text("div.css-1o924a9"),
-                    images=self.get_images(),
-                    location=self.get_location(),
-                    seller_name=self._get_element_text("h4.css-1lcz6o7"),
-                    seller_since=self._get_element_text("p.css-23d1vy"),
-                    last_seen=self._get_element_text("span.css-1p85e15"),
-                    post_date=self._get_element_text("[data-cy='ad-posted-at']")
-                )
-
-                return details
-
-            except WebDriverException:
-                if attempt < self.max_retries - 1:
-                    self.log(f"WebDriver error, reinitializing session (attempt {attempt + 1}/{self.max_retries})")
-                    self._initialize_driver()
-                else:
-                    self.log(f"Failed to get product details after {self.max_retries} attempts")
-                    return None
+        if product_id in self.products:
+            self.log(f"Product {product_id} already exists, skipping...")
+            return None
 
-            except Exception as e:
-                self.log(f"Error getting product details: {str(e)}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-                else:
-                    return None
+        # Get all elements with improved error handling
+        details = ProductDetails(
+            id=product_id,
+            title=self._get_element_text("h4.css-1kc83jo"),
+            price=self._get_element_text("h3.css-90xrc0"),
+            description=self._get_element_text("div.css-1o924a9"),
+            images=self.get_images(),
+            location=self.get_location(),
+            seller_name=self._get_element_text("h4.css-1lcz6o7"),
+            seller_since=self._get_element_text("p.css-23d1vy"),
+            last_seen=self._get_element_text("span.css-1p85e15"),
+            post_date=self._get_element_text("[data-cy='ad-posted-at']")
+        )
+
+        if self.stop_flag.is_set():
+            # Waits were cut short, so the fields are incomplete
+            return None
+
+        if listing:
+            details = ProductDetails(**{field: value or getattr(listing, field)
+                                        for field, value in asdict(details).items()})
+
+        return details
+
+    def _check_ad_available(self, url: str):
+        """Raise a permanent failure if the ad is gone (404/410 or redirected off the ad page)."""
+        if self.last_response_status in (404, 410):
+            raise ScrapeFailure(f"Ad returned HTTP {self.last_response_status}", PERMANENT)
+        current_path = urlsplit(self.driver.current_url).path
+        if '/d/' in urlsplit(url).path and '/d/' not in current_path:
+            raise ScrapeFailure(f"Ad redirected to {self.driver.current_url}", PERMANENT)
 
     def _get_element_text(self, selector: str) -> str:
         """Helper method to safely get element text."""
@@ -272,56 +671,74 @@ class OlxScraper:
         return element.text.strip() if element else ""
 
     def get_product_links(self) -> List[str]:
-        """Get all product links with enhanced pagination handling."""
-        all_links = []
-        page = 1
-        current_url = self.base_url
-
-        while (len(all_links) < self.item_limit and
-               page <= self.page_limit and
-               not self.stop_flag.is_set()):
-
-            self.log(f"\nProcessing page {page}/{self.page_limit}")
-
-            try:
-                self.driver.get(current_url)
-                time.sleep(random.uniform(*self.delays['page_load']))
-
-                page_links = self.get_product_links_from_page()
-                if not page_links:
-                    self.log("No products found on current page")
-                    break
-
-                all_links.extend(page_links)
-                self.total_items_found = len(all_links)
-
-                # Update progress
-                progress = min(0.5, (len(all_links) / self.item_limit) * 0.5)
-                self.progress_callback(progress)
-
-                self.log(f"Found {len(all_links)} products so far (target: {self.item_limit})")
-
-                if len(all_links) >= self.item_limit:
-                    self.log(f"Reached target number of items ({self.item_limit})")
-                    break
-
-                if not self.has_next_page():
-                    self.log("No more pages available")
-                    break
+        """Get all product links, prefetching the remaining listing pages concurrently.
+
+        Page 1 is loaded in the browser to read the pagination block; pages 2..N are then
+        fetched over HTTP in batches of ``max_parallel_pages``. Links are merged in page
+        order and deduplicated, since promoted ads repeat across pages.
+        """
+        all_links: Dict[str, None] = {}
+
+        def merge(page_links: List[str]):
+            for link in page_links:
+                all_links.setdefault(self._normalize_link(link), None)
+            self.total_items_found = len(all_links)
+            progress = min(0.5, (len(all_links) / self.item_limit) * 0.5)
+            self.progress_callback(progress)
+
+        self.log(f"\nProcessing page 1/{self.page_limit}")
+        page_links = self._load_listing_page_in_browser(1)
+        if not page_links:
+            self.log("No products found on current page")
+            return []
+        merge(page_links)
+
+        last_page = min(self.get_total_pages(), self.page_limit)
+        self.log(f"Found {len(all_links)} products so far (target: {self.item_limit}), "
+                 f"{last_page} pages to scan")
+
+        session = self._create_http_session()
+        page = 2
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_parallel_pages) as executor:
+                while (len(all_links) < self.item_limit and
+                       page <= last_page and
+                       not self.stop_flag.is_set()):
+                    self._wait_if_paused()
+                    if self.rate_controller.cooldown_remaining() > 0:
+                        self._cool_down_and_rotate(self.rate_controller.snapshot()['last_signal'])
+                        session.close()
+                        session = self._create_http_session()
+
+                    batch_size = min(self.rate_controller.concurrency, self.max_parallel_pages)
+                    batch = list(range(page, min(page + batch_size, last_page + 1)))
+                    self.log(f"\nFetching pages {batch[0]}-{batch[-1]}/{last_page}")
+
+                    results = list(executor.map(lambda p: self._fetch_listing_page(session, p), batch))
+                    for batch_page, page_links in zip(batch, results):
+                        if page_links is None:
+                            if self.rate_controller.cooldown_remaining() > 0:
+                                # A worker hit a hard block: don't hit the site from the browser mid cool-down
+                                self._cool_down_and_rotate(self.rate_controller.snapshot()['last_signal'])
+                                session.close()
+                                session = self._create_http_session()
+                            page_links = self._load_listing_page_in_browser(batch_page)
+                        if not page_links:
+                            self.log(f"No products found on page {batch_page}")
+                            continue
+                        merge(page_links)
+
+                    self.log(f"Found {len(all_links)} products so far (target: {self.item_limit})")
+                    page = batch[-1] + 1
+        finally:
+            session.close()
 
-                page += 1
-                current_url = f"{self.base_url}?page={page}"
+        if len(all_links) >= self.item_limit:
+            self.log(f"Reached target number of items ({self.item_limit})")
+        elif page > last_page:
+            self.log("No more pages available")
 
-            except WebDriverException:
-                self.log("WebDriver error, reinitializing session...")
-                self._initialize_driver()
-                continue
-
-            except Exception as e:
-                self.log(f"Error processing page {page}: {str(e)}")
-                break
-
-        return all_links[:self.item_limit]
+        return list(all_links)[:self.item_limit]
 
     def _load_existing_products(self) -> Dict:
         """Load existing products with error handling."""
@@ -336,15 +753,22 @@ class OlxScraper:
     def _save_products(self):
         """Save products with error handling."""
         try:
-            os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.products, f, ensure_ascii=False, indent=2)
+            with self.tracer.span('_save_products', count=len(self.products)):
+                os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
+                with open(self.output_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.products, f, ensure_ascii=False, indent=2)
         except Exception as e:
             self.log(f"Error saving products: {str(e)}")
 
     def run(self):
+        """Run the scraper, under the trace recorder when profiling is enabled."""
+        with self.tracer.session():
+            self._run()
+
+    def _run(self):
         """Main execution method with enhanced error handling and session management."""
         try:
+            self.driver_pool.start()
             self._initialize_driver()
             self.log(f"Starting scraping process for {self.base_url}")
 
@@ -356,6 +780,7 @@ class OlxScraper:
             self.log(f"Processing {len(product_links)} products")
 
             for i, link in enumerate(product_links, 1):
+                self._wait_if_paused()
                 if self.stop_flag.is_set():
                     self.log("Stopping scraping process...")
                     break
@@ -364,29 +789,79 @@ class OlxScraper:
                     self.log("Refreshing session...")
                     self._initialize_driver()
 
-                self.log(f"Processing product {i}/{len(product_links)}: {link}")
-                if details := self.get_product_details(link):
-                    self.products[details.id] = asdict(details)
-                    self._save_products()
+                listing = self.listing_ads.get(link)
+                if listing and listing.id in self.products:
+                    self.log(f"Product {listing.id} already exists, skipping...")
+                    continue
+                if self.dead_letters.is_permanent(link):
+                    self.log(f"Skipping dead ad: {link}")
+                    continue
 
+                self.log(f"Processing product {i}/{len(product_links)}: {link}")
+                opened = not (self.listing_only and listing)
+                if self._scrape_product(link, listing, opened):
                     # Update progress
                     progress = 0.5 + (0.5 * i / len(product_links))
                     self.progress_callback(progress)
-                    self.log(f"Successfully saved product: {details.title}")
+
+                if i % 10 == 0:
+                    self.log(f"Rate controller: {self.rate_controller.snapshot()}")
 
                 # Random delay between products
-                time.sleep(random.uniform(*self.delays['action']))
+                if opened:
+                    self._pause('action')
+
+            self._retry_dead_letters()
 
         except Exception as e:
             self.log(f"Critical error: {str(e)}")
         finally:
             if self.driver:
-                try:
-                    self.driver.quit()
-                except:
-                    pass
+                self.driver_pool.retire(self.driver)
+                self.driver = None
+            self.driver_pool.close()
+            self.log(f"Rate controller: {self.rate_controller.snapshot()}")
+            self.log(f"Driver pool: {self.driver_pool.stats()}")
+            if self.dead_letters:
+                self.log(f"{len(self.dead_letters)} failed URLs recorded in {self.dead_letters.path}")
             self.log("Scraping process completed")
 
+    def _scrape_product(self, link: str, listing: Optional[ProductDetails], opened: bool) -> bool:
+        """Fetch (or take from the listing) and save one product; returns True if saved."""
+        with self.tracer.url(link):
+            details = self.get_product_details(link, listing) if opened else listing
+            if not details:
+                return False
+            self.products[details.id] = asdict(details)
+            self._save_products()
+            self.items_saved += 1
+            self.rate_controller.record_item()
+            self.log(f"Successfully saved product: {details.title}")
+            return True
+
+    def _retry_dead_letters(self):
+        """Deferred pass over non-permanent failures from this and earlier runs.
+
+        Stops once ``item_limit`` products have been saved in this run.
+        """
+        pending = self.dead_letters.retryable()
+        if not pending or self.stop_flag.is_set() or self.items_saved >= self.item_limit:
+            return
+
+        self.log(f"Retrying {len(pending)} failed URLs")
+        for link in pending:
+            self._wait_if_paused()
+            if self.stop_flag.is_set():
+                break
+            if self.items_saved >= self.item_limit:
+                self.log(f"Reached target number of items ({self.item_limit})")
+                break
+            if self._should_refresh_session():
+                self._initialize_driver()
+            if self._scrape_product(link, self.listing_ads.get(link), opened=True):
+                self.progress_callback(0.5 + 0.5 * min(1.0, self.items_saved / self.item_limit))
+            self._pause('action')
+
     def _validate_and_clean_product(self, details: ProductDetails) -> Optional[ProductDetails]:
         """Validate and clean product details before saving."""
         if not details.id or not details.title:
@@ -408,8 +883,21 @@ class OlxScraper:
 
         return clean_details
 
+    def _classify_failure(self, error: Exception) -> str:
+        """Sort a failure into permanent, transient or session-fatal."""
+        if isinstance(error, ScrapeFailure):
+            return error.category
+        if isinstance(error, InvalidArgumentException):
+            return PERMANENT
+        if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+            return SESSION_FATAL
+        if isinstance(error, WebDriverException) and \
+                any(marker in str(error).lower() for marker in self.session_markers):
+            return SESSION_FATAL
+        return TRANSIENT
+
     def _handle_webdriver_error(self, error: WebDriverException, context: str):
-        """Handle WebDriver errors with context."""
+        """Handle WebDriver errors with context, rotating the session only when it is dead."""
         self.log(f"WebDriver error during {context}: {str(error)}")
         try:
             if self.driver:
@@ -417,12 +905,9 @@ class OlxScraper:
         except:
             pass
 
-        # Check if error is due to session being expired/invalid
-        if any(msg in str(error).lower() for msg in ["invalid session", "session not created", "no such session"]):
+        if self._classify_failure(error) == SESSION_FATAL:
             self.log("Session appears to be invalid, reinitializing...")
             self._initialize_driver()
-        else:
-            raise error
 
     def _extract_page_data(self) -> dict:
         """Extract all available data from current page with error handling."""
@@ -486,37 +971,39 @@ class OlxScraper:
             self.log(f"Error verifying page load: {str(e)}")
             return False
 
-    def _handle_captcha(self) -> bool:
-        """Handle potential CAPTCHA challenges."""
-        captcha_indicators = [
-            "captcha",
-            "security check",
-            "verify you're human"
-        ]
-
-        try:
-            page_source = self.driver.page_source.lower()
-            if any(indicator in page_source for indicator in captcha_indicators):
-                self.log("CAPTCHA detected, waiting for manual resolution...")
-                # Wait for manual intervention
-                time.sleep(30)  # Adjust based on your needs
-                return True
-        except Exception as e:
-            self.log(f"Error handling CAPTCHA: {str(e)}")
-        return False
-
-    def _retry_with_backoff(self, func, max_retries: int = 3, initial_delay: int = 5):
-        """Execute a function with exponential backoff retry logic."""
+    def _retry_with_backoff(self, func, context: str, max_retries: Optional[int] = None,
+                            initial_delay: Optional[float] = None):
+        """Execute a function with per-category retries and jittered exponential backoff.
+
+        Permanent failures are raised immediately, session-fatal ones swap in a new driver
+        (even on the last attempt, so the next URL gets a live session) and transient ones
+        just back off. The last error is re-raised once the attempts run out or on stop.
+        A DriverUnavailable is never retried.
+        """
+        max_retries = max_retries or self.max_retries
+        initial_delay = initial_delay or self.retry_delay
         for attempt in range(max_retries):
             try:
                 return func()
+            except DriverUnavailable:
+                raise
             except Exception as e:
+                category = self._classify_failure(e)
+                if category == PERMANENT or self.stop_flag.is_set():
+                    raise
+
+                if category == SESSION_FATAL:
+                    self._handle_webdriver_error(e, context)
+                    delay = random.uniform(0, initial_delay / 5)
+                else:
+                    delay = random.uniform(0, initial_delay * (2 ** attempt))  # Full-jitter backoff
                 if attempt == max_retries - 1:
-                    raise e
+                    raise
 
-                delay = initial_delay * (2 ** attempt)  # Exponential backoff
-                self.log(f"Attempt {attempt + 1} failed, retrying in {delay} seconds...")
-                time.sleep(delay)
+                self.log(f"Attempt {attempt + 1}/{max_retries} failed ({category}: {str(e)}), "
+                         f"retrying in {delay:.1f} seconds...")
+                if self.stop_flag.wait(delay):
+                    raise
 
     def _save_error_report(self, error: Exception, context: str):
         """Save detailed error reports for debugging."""
@@ -546,7 +1033,9 @@ class OlxScraper:
         """Perform cleanup operations."""
         try:
             if self.driver:
-                self.driver.quit()
+                self.driver_pool.retire(self.driver)
+                self.driver = None
+            self.driver_pool.close()
             self._save_products()  # Final save of any remaining data
             self.log("Cleanup completed successfully")
         except Exception as e:
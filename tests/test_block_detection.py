@@ -0,0 +1,75 @@
+import threading
+from datetime import timedelta
+
+import pytest
+
+from service import OlxScraper
+
+
+class FakeResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.elapsed = timedelta(seconds=0.5)
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, timeout=None):
+        return self.response
+
+
+LISTING_BODY = '''
+<body>
+  <h1>Phones</h1>
+  <div data-cy="l-card"><a href="/d/oferta/phone-ID1.html">Phone</a></div>
+  <div data-cy="l-card"><a href="/d/oferta/case-ID2.html">Case</a></div>
+</body>
+'''
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    scraper = OlxScraper('https://x/list', str(tmp_path / 'out.json'), 5,
+                         lambda progress: None, threading.Event(), lambda message: None)
+    monkeypatch.setattr(scraper, '_pause', lambda kind: None)
+    return scraper
+
+
+def test_captcha_script_in_head_is_not_a_block(scraper):
+    html = ('<html><head><title>Phones - OLX</title>'
+            '<script src="https://www.google.com/recaptcha/api.js"></script>'
+            '<script>window.config = {"captchaEnabled": true};</script>'
+            '<style>.captcha { display: none; }</style></head>' + LISTING_BODY + '</html>')
+
+    links = scraper._fetch_listing_page(FakeSession(FakeResponse(html)), 2)
+
+    assert links == ['https://x/d/oferta/phone-ID1.html', 'https://x/d/oferta/case-ID2.html']
+    assert scraper.rate_controller.snapshot()['hard_blocks'] == 0
+
+
+def test_visible_captcha_is_a_block(scraper):
+    html = ('<html><head><title>Security check</title></head>'
+            '<body><p>Please verify you\'re human</p></body></html>')
+
+    assert scraper._fetch_listing_page(FakeSession(FakeResponse(html)), 2) is None
+    assert scraper.rate_controller.snapshot()['hard_blocks'] == 1
+
+
+@pytest.mark.parametrize('status, signal', [(403, 'forbidden'), (429, 'too_many_requests')])
+def test_block_status_codes(scraper, status, signal):
+    response = FakeResponse('<html><body></body></html>', status)
+
+    assert scraper._fetch_listing_page(FakeSession(response), 2) is None
+    assert scraper.rate_controller.snapshot()['last_signal'] == signal
+
+
+def test_page_without_cards_is_a_soft_block(scraper):
+    response = FakeResponse('<html><body><p>Nothing here</p></body></html>')
+
+    assert scraper._fetch_listing_page(FakeSession(response), 2) is None
+    snapshot = scraper.rate_controller.snapshot()
+    assert (snapshot['hard_blocks'], snapshot['soft_blocks']) == (0, 1)
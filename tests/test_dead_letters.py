@@ -0,0 +1,49 @@
+import json
+
+from dead_letters import DeadLetterQueue
+
+
+def make_queue(tmp_path, **kwargs):
+    return DeadLetterQueue(str(tmp_path / 'out.failed.json'), lambda message: None, **kwargs)
+
+
+def test_add_persists_and_counts_failures(tmp_path):
+    queue = make_queue(tmp_path)
+    queue.add('https://x/d/a.html', 'transient', TimeoutError('slow'))
+    queue.add('https://x/d/a.html', 'transient', TimeoutError('slower'))
+
+    saved = json.loads((tmp_path / 'out.failed.json').read_text(encoding='utf-8'))
+    entry = saved['https://x/d/a.html']
+    assert entry['failures'] == 2
+    assert entry['error_type'] == 'TimeoutError'
+    assert entry['error_message'] == 'slower'
+
+
+def test_entries_survive_reload(tmp_path):
+    make_queue(tmp_path).add('https://x/d/a.html', 'permanent', ValueError('gone'))
+    queue = make_queue(tmp_path)
+    assert 'https://x/d/a.html' in queue
+    assert queue.is_permanent('https://x/d/a.html')
+
+
+def test_remove(tmp_path):
+    queue = make_queue(tmp_path)
+    queue.add('https://x/d/a.html', 'transient', TimeoutError())
+    queue.remove('https://x/d/a.html')
+    queue.remove('https://x/d/missing.html')
+    assert len(make_queue(tmp_path)) == 0
+
+
+def test_retryable_skips_permanent_and_exhausted(tmp_path):
+    queue = make_queue(tmp_path, max_failures=2)
+    queue.add('https://x/d/gone.html', 'permanent', ValueError())
+    queue.add('https://x/d/once.html', 'transient', TimeoutError())
+    queue.add('https://x/d/session.html', 'session', RuntimeError())
+    for _ in range(2):
+        queue.add('https://x/d/exhausted.html', 'transient', TimeoutError())
+    assert queue.retryable() == ['https://x/d/once.html', 'https://x/d/session.html']
+
+
+def test_corrupt_file_starts_empty(tmp_path):
+    (tmp_path / 'out.failed.json').write_text('{not json', encoding='utf-8')
+    assert len(make_queue(tmp_path)) == 0
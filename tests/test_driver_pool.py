@@ -0,0 +1,109 @@
+import threading
+import time
+
+from driver_pool import DriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.healthy = True
+        self.quit_called = threading.Event()
+
+    def execute_script(self, script):
+        if not self.healthy:
+            raise RuntimeError("session deleted")
+        return 1
+
+    def quit(self):
+        self.quit_called.set()
+
+
+class FakeFactory:
+    def __init__(self, launch_seconds=0.0):
+        self.launch_seconds = launch_seconds
+        self.drivers = []
+
+    def __call__(self):
+        time.sleep(self.launch_seconds)
+        driver = FakeDriver()
+        self.drivers.append(driver)
+        return driver
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_acquire_uses_warm_spare():
+    factory = FakeFactory(launch_seconds=0.2)
+    pool = DriverPool(factory, lambda message: None, spares=1)
+    pool.start()
+    try:
+        assert wait_until(lambda: len(pool._idle) == 1)
+        pool.acquire()
+        stats = pool.stats()
+        assert stats['warm_swaps'] == 1
+        assert stats['avg_stall_seconds'] < 0.1
+    finally:
+        pool.close()
+
+
+def test_acquire_cold_launches_without_spare():
+    factory = FakeFactory()
+    pool = DriverPool(factory, lambda message: None, spares=0)
+    driver = pool.acquire()
+    assert driver is factory.drivers[0]
+    assert pool.stats()['warm_swaps'] == 0
+
+
+def test_unhealthy_spare_is_replaced():
+    factory = FakeFactory()
+    pool = DriverPool(factory, lambda message: None, spares=0)
+    spare = FakeDriver()
+    spare.healthy = False
+    pool._idle.append((spare, time.time()))
+    driver = pool.acquire()
+    assert driver is not spare
+    assert spare.quit_called.wait(1)
+    assert pool.stats()['unhealthy_spares'] == 1
+
+
+def test_expired_spare_is_replaced():
+    pool = DriverPool(FakeFactory(), lambda message: None, spares=0, max_idle_seconds=10)
+    spare = FakeDriver()
+    pool._idle.append((spare, time.time() - 60))
+    pool._check_idle()
+    assert not pool._idle
+    assert spare.quit_called.wait(1)
+
+
+def test_retiring_threads_are_pruned():
+    pool = DriverPool(FakeFactory(), lambda message: None, spares=0)
+    drivers = [FakeDriver() for _ in range(20)]
+    for driver in drivers:
+        pool.retire(driver)
+        driver.quit_called.wait(1)
+    pool.retire(FakeDriver())
+    assert len(pool._retiring) <= 2
+    pool.close()
+    assert not pool._retiring
+
+
+def test_spare_launched_after_close_is_quit():
+    factory = FakeFactory(launch_seconds=0.3)
+    pool = DriverPool(factory, lambda message: None, spares=1)
+    pool.start()
+    assert wait_until(lambda: pool._thread.is_alive())
+    time.sleep(0.05)  # the warming thread is now inside factory()
+    pool._closed.set()
+    pool._wakeup.set()
+    with pool._lock:
+        assert not pool._idle
+    pool._thread.join(timeout=2)
+    assert not pool._idle
+    assert factory.drivers[0].quit_called.is_set()
@@ -0,0 +1,109 @@
+import json
+import threading
+
+import pytest
+
+from service import OlxScraper, ProductDetails
+
+
+AD = {
+    'id': 901234567,
+    'url': 'https://x/d/oferta/iphone-13-CID99-ID1abcd.html',
+    'title': 'iPhone 13 128GB',
+    'description': 'Stan idealny.<br />Bateria 91%<br/>Etui <b>gratis</b> &amp; szkło',
+    'createdTime': '2024-05-01T10:15:00+02:00',
+    'price': {
+        'displayValue': '2 100 zł',
+        'regularPrice': {'value': 2100, 'currencyCode': 'PLN'},
+    },
+    'location': {'cityName': 'Kraków', 'districtName': 'Podgórze'},
+    'photos': [
+        'https://ireland.apollo.olxcdn.com/v1/files/abc/image;s={width}x{height}',
+        {'link': 'https://ireland.apollo.olxcdn.com/v1/files/def/image;s={width}x{height}'},
+    ],
+    'user': {'name': 'Jan', 'created': '2019-03-02', 'lastSeen': '2024-05-02T08:00:00+02:00'},
+}
+
+
+def listing_page(state) -> str:
+    blob = json.dumps(json.dumps(state))
+    return ('<html><head><title>Telefony - OLX</title>'
+            f'<script type="text/javascript">window.__PRERENDERED_STATE__= {blob};'
+            'window.__TAURUS__ = {};</script></head>'
+            '<body><div data-cy="l-card"><a href="/d/oferta/other-ID2.html">x</a></div></body></html>')
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    return OlxScraper('https://x/list', str(tmp_path / 'out.json'), 5,
+                      lambda progress: None, threading.Event(), lambda message: None)
+
+
+def test_ads_from_prerendered_state(scraper):
+    second = {'id': 2, 'url': '/d/oferta/second-ID2.html', 'title': 'Second'}
+    html = listing_page({'listing': {'listing': {'ads': [AD, second, {'title': 'no id'}]}}})
+
+    ads = scraper._listing_ads_from_html(html)
+    links = scraper._remember_listing_ads(ads, 'https://x/list/?page=2')
+
+    assert links == [AD['url'], 'https://x/d/oferta/second-ID2.html']
+    assert scraper.listing_ads['https://x/d/oferta/second-ID2.html'].title == 'Second'
+
+
+@pytest.mark.parametrize('html', [
+    '<html><body>no state here</body></html>',
+    '<script>window.__PRERENDERED_STATE__= "{not json";</script>',
+    '<script>window.__PRERENDERED_STATE__= "[1, 2]";</script>',
+    listing_page({'listing': {}}),
+])
+def test_missing_or_malformed_state(scraper, html):
+    assert scraper._listing_ads_from_html(html) == []
+
+
+def test_listing_product_mapping():
+    product = OlxScraper._listing_product(AD)
+
+    assert product.id == '901234567'
+    assert product.title == 'iPhone 13 128GB'
+    assert product.price == '2 100 zł'
+    assert product.description == 'Stan idealny.\nBateria 91%\nEtui gratis & szkło'
+    assert product.location == 'Kraków, Podgórze'
+    assert product.images == ['https://ireland.apollo.olxcdn.com/v1/files/abc/image;s=1000x700',
+                              'https://ireland.apollo.olxcdn.com/v1/files/def/image;s=1000x700']
+    assert (product.seller_name, product.seller_since) == ('Jan', '2019-03-02')
+    assert product.post_date == '2024-05-01T10:15:00+02:00'
+
+
+def test_listing_product_falls_back_to_regular_price():
+    ad = {'id': 1, 'url': '/d/1', 'price': {'regularPrice': {'value': 50, 'currencyCode': 'PLN'}},
+          'location': {'cityName': 'Gdańsk'}}
+    product = OlxScraper._listing_product(ad)
+
+    assert (product.price, product.location, product.images) == ('50 PLN', 'Gdańsk', [])
+
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+
+def test_ad_page_fields_are_filled_from_listing(scraper, monkeypatch):
+    page = {'h4.css-1kc83jo': 'iPhone 13 128GB - okazja', 'h3.css-90xrc0': ''}
+    monkeypatch.setattr(scraper, '_navigate', lambda url: None)
+    monkeypatch.setattr(scraper, '_check_ad_available', lambda url: None)
+    monkeypatch.setattr(scraper, '_simulate_human_behavior', lambda: None)
+    monkeypatch.setattr(scraper, 'get_images', lambda: [])
+    monkeypatch.setattr(scraper, 'get_location', lambda: '')
+    monkeypatch.setattr(scraper, 'wait_for_element',
+                        lambda selector, timeout=10: FakeElement(page[selector]) if selector in page else None)
+    listing = OlxScraper._listing_product(AD)
+
+    details = scraper._extract_product_details(AD['url'], listing)
+
+    assert isinstance(details, ProductDetails)
+    assert details.id == listing.id
+    assert details.title == 'iPhone 13 128GB - okazja'
+    assert details.price == '2 100 zł'
+    assert details.location == 'Kraków, Podgórze'
+    assert details.images == listing.images
+    assert details.last_seen == listing.last_seen
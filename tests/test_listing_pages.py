@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from service import OlxScraper
+
+
+class FakeSession:
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def ad(name, query=''):
+    return f'https://x/d/oferta/{name}.html{query}'
+
+
+@pytest.fixture
+def make_scraper(tmp_path, monkeypatch):
+    def make(pages, item_limit=100, page_limit=100, fetched=None,
+             base_url='https://x/elektronika/?search%5Bfilter_float_price%3Afrom%5D=100'):
+        scraper = OlxScraper(base_url, str(tmp_path / 'out.json'), item_limit,
+                             lambda progress: None, threading.Event(), lambda message: None,
+                             page_limit=page_limit)
+        scraper.browser_pages = []
+        scraper.session = FakeSession()
+        fetched = pages if fetched is None else fetched
+
+        def load_in_browser(page):
+            scraper.browser_pages.append(page)
+            return pages.get(page, [])
+        monkeypatch.setattr(scraper, '_load_listing_page_in_browser', load_in_browser)
+        monkeypatch.setattr(scraper, '_fetch_listing_page', lambda session, page: fetched.get(page, []))
+        monkeypatch.setattr(scraper, '_create_http_session', lambda: scraper.session)
+        monkeypatch.setattr(scraper, 'get_total_pages', lambda: max(pages))
+        return scraper
+    return make
+
+
+def test_page_url_keeps_filters_and_replaces_page(make_scraper):
+    scraper = make_scraper({1: []}, base_url='https://x/elektronika/?search%5Border%5D=created_at&page=4')
+
+    assert scraper._build_page_url(3) == 'https://x/elektronika/?search%5Border%5D=created_at&page=3'
+
+
+def test_first_page_has_no_page_parameter(make_scraper):
+    scraper = make_scraper({1: []}, base_url='https://x/elektronika/?page=7')
+
+    assert scraper._build_page_url(1) == 'https://x/elektronika/'
+
+
+def test_normalize_link_drops_tracking():
+    assert (OlxScraper._normalize_link(ad('a', '?reason=extended_search_promoted#photos'))
+            == ad('a'))
+
+
+def test_promoted_ads_are_deduplicated_in_page_order(make_scraper):
+    promoted = ad('promoted', '?reason=observed_promoted')
+    scraper = make_scraper({
+        1: [promoted, ad('a'), ad('b')],
+        2: [ad('promoted', '?reason=extended_search'), ad('c')],
+        3: [ad('b'), ad('d'), promoted],
+    })
+
+    assert scraper.get_product_links() == [ad('promoted'), ad('a'), ad('b'), ad('c'), ad('d')]
+    assert scraper.total_items_found == 5
+    assert scraper.session.closed
+
+
+def test_item_limit_truncates(make_scraper):
+    scraper = make_scraper({1: [ad('a'), ad('b')], 2: [ad('c'), ad('d')], 3: [ad('e')]},
+                           item_limit=3)
+
+    assert scraper.get_product_links() == [ad('a'), ad('b'), ad('c')]
+
+
+def test_page_limit_stops_before_later_pages(make_scraper):
+    scraper = make_scraper({1: [ad('a')], 2: [ad('b')], 3: [ad('c')], 4: [ad('d')]},
+                           page_limit=2)
+
+    assert scraper.get_product_links() == [ad('a'), ad('b')]
+
+
+def test_failed_fetch_falls_back_to_browser(make_scraper):
+    pages = {1: [ad('a')], 2: [ad('b')], 3: [ad('c')]}
+    scraper = make_scraper(pages, fetched={2: None, 3: [ad('c')]})
+
+    assert scraper.get_product_links() == [ad('a'), ad('b'), ad('c')]
+    assert scraper.browser_pages == [1, 2]
+
+
+def test_empty_first_page_returns_nothing(make_scraper):
+    scraper = make_scraper({1: [], 2: [ad('b')]})
+
+    assert scraper.get_product_links() == []
@@ -0,0 +1,56 @@
+import glob
+import json
+import os
+
+from profiler import TraceRecorder
+
+
+def trace_events(output_dir):
+    with open(glob.glob(os.path.join(output_dir, 'trace_*.json'))[0], encoding='utf-8') as f:
+        text = f.read().strip()
+    # The JSON array trace format allows the closing bracket to be missing
+    if not text.endswith(']'):
+        text = text.rstrip(',') + ']'
+    return json.loads(text)
+
+
+def test_disabled_recorder_is_a_no_op(tmp_path):
+    recorder = TraceRecorder(None, lambda message: None)
+    with recorder.session(), recorder.url('https://x/d/a.html'), recorder.span('driver.get'):
+        pass
+    assert not os.listdir(tmp_path)
+
+
+def test_trace_is_streamed_per_ad(tmp_path):
+    recorder = TraceRecorder(str(tmp_path), lambda message: None)
+    with recorder.session():
+        with recorder.url('https://x/d/a.html'):
+            with recorder.span('wait_for_element', selector='h4', timeout=20):
+                pass
+        # Loadable before the run ends, e.g. after the worker is killed
+        names = [event['name'] for event in trace_events(tmp_path)]
+        assert names == ['wait_for_element', 'ad']
+        assert not recorder._events
+    events = trace_events(tmp_path)
+    assert events[0]['args'] == {'selector': 'h4', 'timeout': '20'}
+    assert events[-1]['name'] == 'trace_end'
+
+
+def test_slowest_report_keeps_only_top_n(tmp_path):
+    recorder = TraceRecorder(str(tmp_path), lambda message: None, slowest=2)
+    with recorder.session():
+        for index, total in enumerate([1.0, 5.0, 3.0, 2.0]):
+            recorder._keep_if_slow({'url': f'ad{index}', 'spans': {'driver.get': total}, 'total': total})
+    assert len(recorder._slowest) == 2
+    report = recorder._slowest_report()
+    assert report.startswith("Slowest 2 of 4 traced ads")
+    assert report.index('ad1') < report.index('ad2')
+    assert 'ad0' not in report
+
+
+def test_unsampled_ads_record_nothing(tmp_path):
+    recorder = TraceRecorder(str(tmp_path), lambda message: None, sample_rate=0.0)
+    with recorder.session():
+        with recorder.url('https://x/d/a.html'), recorder.span('driver.get'):
+            pass
+    assert [event['name'] for event in trace_events(tmp_path)] == ['trace_end']
@@ -0,0 +1,194 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import (InvalidArgumentException, InvalidSessionIdException,
+                                        TimeoutException, WebDriverException)
+
+import service
+from service import (DriverUnavailable, OlxScraper, ProductDetails, ScrapeFailure,
+                     PERMANENT, SESSION_FATAL, TRANSIENT)
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    scraper = OlxScraper('https://x/list', str(tmp_path / 'out.json'), 5,
+                         lambda progress: None, threading.Event(), lambda message: None)
+    scraper.retry_delay = 0.01
+    scraper.driver = object()
+    scraper.rotations = 0
+
+    def rotate():
+        scraper.rotations += 1
+    monkeypatch.setattr(scraper, '_initialize_driver', rotate)
+    return scraper
+
+
+def details(product_id='1'):
+    return ProductDetails(id=product_id, title='t', price='', description='', images=[],
+                          location='', seller_name='', seller_since='', last_seen='', post_date='')
+
+
+@pytest.mark.parametrize('error, category', [
+    (ScrapeFailure('gone', PERMANENT), PERMANENT),
+    (InvalidArgumentException('invalid argument'), PERMANENT),
+    (InvalidSessionIdException('invalid session id'), SESSION_FATAL),
+    (WebDriverException('chrome not reachable'), SESSION_FATAL),
+    (WebDriverException('disconnected: not connected to DevTools'), SESSION_FATAL),
+    (TimeoutException('timeout: Timed out receiving message'), TRANSIENT),
+    (WebDriverException('unknown error: net::ERR_CONNECTION_RESET'), TRANSIENT),
+    (ValueError('boom'), TRANSIENT),
+])
+def test_classify_failure(scraper, error, category):
+    assert scraper._classify_failure(error) == category
+
+
+def test_permanent_failure_is_not_retried(scraper):
+    calls = []
+
+    def gone(url, listing):
+        calls.append(url)
+        raise ScrapeFailure('Ad returned HTTP 404', PERMANENT)
+    scraper._extract_product_details = gone
+
+    assert scraper.get_product_details('https://x/d/a.html') is None
+    assert len(calls) == 1
+    assert scraper.dead_letters.is_permanent('https://x/d/a.html')
+
+
+def test_transient_failure_retries_then_dead_letters(scraper):
+    calls = []
+
+    def timeout(url, listing):
+        calls.append(url)
+        raise TimeoutException('timeout')
+    scraper._extract_product_details = timeout
+
+    assert scraper.get_product_details('https://x/d/a.html') is None
+    assert len(calls) == scraper.max_retries
+    assert scraper.rotations == 0
+    assert scraper.dead_letters.retryable() == ['https://x/d/a.html']
+
+
+def test_session_fatal_rotates_and_retries(scraper):
+    results = [WebDriverException('chrome not reachable'), details()]
+
+    def flaky(url, listing):
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    scraper._extract_product_details = flaky
+
+    assert scraper.get_product_details('https://x/d/a.html').id == '1'
+    assert scraper.rotations == 1
+    assert 'https://x/d/a.html' not in scraper.dead_letters
+
+
+def test_session_fatal_on_last_attempt_still_rotates(scraper):
+    def dead(url, listing):
+        raise InvalidSessionIdException('invalid session id')
+    scraper._extract_product_details = dead
+
+    scraper.get_product_details('https://x/d/a.html')
+    assert scraper.rotations == scraper.max_retries
+
+
+def test_driver_launch_failure_aborts_instead_of_dead_lettering(scraper, monkeypatch):
+    def launch_fails():
+        scraper.driver = None
+        raise DriverUnavailable('Failed to initialize WebDriver: chrome crashed')
+    monkeypatch.setattr(scraper, '_initialize_driver', launch_fails)
+
+    def dead(url, listing):
+        raise InvalidSessionIdException('invalid session id')
+    scraper._extract_product_details = dead
+
+    with pytest.raises(DriverUnavailable):
+        scraper.get_product_details('https://x/d/a.html')
+    assert len(scraper.dead_letters) == 0
+
+
+def test_navigate_without_driver_raises(scraper):
+    scraper.driver = None
+    with pytest.raises(DriverUnavailable):
+        scraper._navigate('https://x/d/a.html')
+
+
+def test_initialize_driver_failure_raises_driver_unavailable(tmp_path):
+    scraper = OlxScraper('https://x/list', str(tmp_path / 'out.json'), 5,
+                         lambda progress: None, threading.Event(), lambda message: None)
+
+    def launch_fails():
+        raise WebDriverException('session not created')
+    scraper.driver_pool.acquire = launch_fails
+
+    with pytest.raises(DriverUnavailable):
+        scraper._initialize_driver()
+    assert scraper.driver is None
+
+
+def test_stop_during_backoff_does_not_retry(scraper, monkeypatch):
+    calls = []
+
+    def timeout(url, listing):
+        calls.append(url)
+        scraper.stop_flag.set()
+        raise TimeoutException('timeout')
+    scraper._extract_product_details = timeout
+    monkeypatch.setattr(service.random, 'uniform', lambda low, high: 30)
+
+    assert scraper.get_product_details('https://x/d/a.html') is None
+    assert len(calls) == 1
+    assert len(scraper.dead_letters) == 0
+
+
+def test_stop_keeps_pending_dead_letter(scraper):
+    scraper.dead_letters.add('https://x/d/a.html', TRANSIENT, TimeoutException('timeout'))
+
+    def stopped(url, listing):
+        scraper.stop_flag.set()
+        return None
+    scraper._extract_product_details = stopped
+
+    assert scraper.get_product_details('https://x/d/a.html') is None
+    assert scraper.dead_letters.retryable() == ['https://x/d/a.html']
+
+
+def test_success_and_already_saved_clear_dead_letter(scraper):
+    for url in ('https://x/d/a.html', 'https://x/d/b.html'):
+        scraper.dead_letters.add(url, TRANSIENT, TimeoutException('timeout'))
+
+    scraper._extract_product_details = lambda url, listing: details()
+    scraper.get_product_details('https://x/d/a.html')
+    scraper._extract_product_details = lambda url, listing: None  # already saved
+    scraper.get_product_details('https://x/d/b.html')
+
+    assert len(scraper.dead_letters) == 0
+
+
+def test_dead_letter_pass_respects_item_limit_and_reports_progress(scraper, monkeypatch):
+    for name in 'abcdefg':
+        scraper.dead_letters.add(f'https://x/d/{name}.html', TRANSIENT, TimeoutException('timeout'))
+    monkeypatch.setattr(scraper, '_should_refresh_session', lambda: False)
+    monkeypatch.setattr(scraper, '_pause', lambda kind: None)
+    saved = iter(range(100))
+    scraper._extract_product_details = lambda url, listing: details(str(next(saved)))
+    scraper.items_saved = 3
+    reported = []
+    scraper.progress_callback = lambda progress: reported.append((progress, scraper.items_saved))
+
+    scraper._retry_dead_letters()
+
+    assert scraper.items_saved == scraper.item_limit == 5
+    assert reported == [(0.9, 4), (1.0, 5)]
+    assert len(scraper.dead_letters) == 5
+
+
+def test_dead_letter_pass_skipped_when_limit_reached(scraper):
+    scraper.dead_letters.add('https://x/d/a.html', TRANSIENT, TimeoutException('timeout'))
+    scraper.items_saved = scraper.item_limit
+    scraper._extract_product_details = lambda url, listing: pytest.fail('should not retry')
+
+    scraper._retry_dead_letters()
+
+    assert 'https://x/d/a.html' in scraper.dead_letters
@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+
+import throttle
+from throttle import AdaptiveRateController
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(throttle.time, 'time', lambda: now[0])
+    return now
+
+
+def make_controller(**kwargs):
+    options = dict(initial_concurrency=4, max_concurrency=8, healthy_streak=2,
+                   base_cooldown=60, max_cooldown=600, congestion_window=10)
+    options.update(kwargs)
+    return AdaptiveRateController(**options)
+
+
+def test_healthy_streak_increases_concurrency_and_lowers_delay(clock):
+    controller = make_controller()
+    controller.record_success(0.5)
+    assert controller.concurrency == 4
+    controller.record_success(0.5)
+    assert controller.concurrency == 5
+    assert controller.delay_scale == pytest.approx(0.9)
+
+
+def test_increase_is_capped(clock):
+    controller = make_controller(initial_concurrency=8, min_delay_scale=0.95)
+    for _ in range(10):
+        controller.record_success(0.5)
+    assert controller.concurrency == 8
+    assert controller.delay_scale == pytest.approx(0.95)
+
+
+def test_hard_block_halves_concurrency_and_starts_cooldown(clock):
+    controller = make_controller()
+    assert controller.record_block('too_many_requests') is True
+    assert controller.concurrency == 2
+    assert controller.delay_scale == pytest.approx(2.0)
+    assert controller.cooldown_remaining() == pytest.approx(60)
+
+
+def test_consecutive_hard_blocks_grow_cooldown_up_to_max(clock):
+    controller = make_controller(initial_concurrency=8)
+    cooldowns = []
+    for _ in range(6):
+        clock[0] += 1000
+        controller.record_block('captcha')
+        cooldowns.append(controller.cooldown_remaining())
+    assert cooldowns == [60, 120, 240, 480, 600, 600]
+    assert controller.concurrency == 1
+
+
+def test_success_resets_consecutive_blocks(clock):
+    controller = make_controller()
+    controller.record_block('forbidden')
+    clock[0] += 1000
+    controller.record_success(0.5)
+    controller.record_block('forbidden')
+    assert controller.cooldown_remaining() == pytest.approx(60)
+
+
+def test_blocks_in_one_congestion_window_back_off_once(clock):
+    controller = make_controller(initial_concurrency=8)
+    for _ in range(8):
+        controller.record_block('too_many_requests')
+    snapshot = controller.snapshot()
+    assert controller.concurrency == 4
+    assert controller.cooldown_remaining() == pytest.approx(60)
+    assert snapshot['hard_blocks'] == 8
+    assert snapshot['consecutive_blocks'] == 1
+
+
+def test_soft_signals_back_off_gently_without_rotation(clock):
+    controller = make_controller()
+    assert controller.record_block('empty') is False
+    assert controller.concurrency == 3
+    assert controller.delay_scale == pytest.approx(1.5)
+    assert controller.cooldown_remaining() == 0
+
+
+def test_slow_response_counts_as_soft_block(clock):
+    controller = make_controller(slow_response_threshold=5)
+    controller.record_success(30)
+    snapshot = controller.snapshot()
+    assert snapshot['soft_blocks'] == 1
+    assert snapshot['successes'] == 0
+    assert snapshot['last_signal'] == 'slow'
+
+
+def test_delay_is_scaled(clock):
+    controller = make_controller()
+    controller.record_block('captcha')
+    assert 4 <= controller.delay((2, 5)) <= 10
+
+
+def test_wait_for_cooldown_returns_false_when_stopped():
+    controller = make_controller(base_cooldown=30)
+    controller.record_block('captcha')
+    stop_flag = threading.Event()
+    stop_flag.set()
+    assert controller.wait_for_cooldown(stop_flag) is False
+
+
+def test_wait_for_cooldown_without_cooldown():
+    assert make_controller().wait_for_cooldown(threading.Event()) is True
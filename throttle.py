@@ -0,0 +1,142 @@
+import math
+import random
+import threading
+import time
+from typing import Dict, Tuple
+
+
+class AdaptiveRateController:
+    """AIMD-style pacing for the scraper.
+
+    While responses are healthy, concurrency grows by one and the delay scale shrinks by
+    a fixed step every ``healthy_streak`` successes. Hard block signals (CAPTCHA, HTTP
+    403/429) halve concurrency, double the delay scale and start an exponentially growing
+    cool-down; soft signals (slow responses, empty listing pages) back off more gently.
+    Signals arriving within ``congestion_window`` seconds of the last decrease belong to
+    the same congestion event and are only counted, so a batch of concurrent failures
+    backs off once. All methods are thread-safe so listing prefetch workers can report
+    into it.
+    """
+
+    HARD_SIGNALS = ('captcha', 'forbidden', 'too_many_requests')
+    SOFT_SIGNALS = ('slow', 'empty')
+
+    def __init__(self, min_concurrency: int = 1, max_concurrency: int = 8,
+                 initial_concurrency: int = 2, min_delay_scale: float = 0.25,
+                 max_delay_scale: float = 8.0, delay_step: float = 0.1,
+                 healthy_streak: int = 5, slow_response_threshold: float = 15.0,
+                 base_cooldown: float = 60, max_cooldown: float = 600,
+                 congestion_window: float = 10.0):
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.min_delay_scale = min_delay_scale
+        self.max_delay_scale = max_delay_scale
+        self.delay_step = delay_step
+        self.healthy_streak = healthy_streak
+        self.slow_response_threshold = slow_response_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.congestion_window = congestion_window
+
+        self._lock = threading.Lock()
+        self._concurrency = initial_concurrency
+        self._delay_scale = 1.0
+        self._streak = 0
+        self._consecutive_blocks = 0
+        self._cooldown_until = 0.0
+        self._last_hard_decrease = float('-inf')
+        self._last_soft_decrease = float('-inf')
+        self._started_at = time.time()
+        self._counters = {'successes': 0, 'hard_blocks': 0, 'soft_blocks': 0,
+                          'rotations': 0, 'items': 0}
+        self._last_signal = None
+
+    @property
+    def concurrency(self) -> int:
+        with self._lock:
+            return self._concurrency
+
+    @property
+    def delay_scale(self) -> float:
+        with self._lock:
+            return self._delay_scale
+
+    def record_success(self, latency: float):
+        """Report a healthy response; slow ones are treated as a soft block."""
+        if latency > self.slow_response_threshold:
+            self.record_block('slow')
+            return
+        with self._lock:
+            self._counters['successes'] += 1
+            self._consecutive_blocks = 0
+            self._streak += 1
+            if self._streak >= self.healthy_streak:
+                self._streak = 0
+                self._concurrency = min(self.max_concurrency, self._concurrency + 1)
+                self._delay_scale = max(self.min_delay_scale, self._delay_scale - self.delay_step)
+
+    def record_block(self, signal: str) -> bool:
+        """Report a block signal. Returns True when the session should be rotated."""
+        with self._lock:
+            now = time.time()
+            self._streak = 0
+            self._last_signal = signal
+            if signal in self.HARD_SIGNALS:
+                self._counters['hard_blocks'] += 1
+                if now - self._last_hard_decrease < self.congestion_window:
+                    return True
+                self._last_hard_decrease = now
+                self._consecutive_blocks += 1
+                self._concurrency = max(self.min_concurrency, self._concurrency // 2)
+                self._delay_scale = min(self.max_delay_scale, self._delay_scale * 2)
+                cooldown = min(self.max_cooldown,
+                               self.base_cooldown * 2 ** (self._consecutive_blocks - 1))
+                self._cooldown_until = max(self._cooldown_until, now + cooldown)
+                return True
+
+            self._counters['soft_blocks'] += 1
+            if now - self._last_soft_decrease < self.congestion_window:
+                return False
+            self._last_soft_decrease = now
+            self._concurrency = max(self.min_concurrency, math.ceil(self._concurrency * 0.75))
+            self._delay_scale = min(self.max_delay_scale, self._delay_scale * 1.5)
+            return False
+
+    def record_rotation(self):
+        with self._lock:
+            self._counters['rotations'] += 1
+
+    def record_item(self):
+        with self._lock:
+            self._counters['items'] += 1
+
+    def delay(self, bounds: Tuple[float, float]) -> float:
+        """Pick a random delay from ``bounds`` scaled by the current delay scale."""
+        with self._lock:
+            scale = self._delay_scale
+        return random.uniform(bounds[0] * scale, bounds[1] * scale)
+
+    def cooldown_remaining(self) -> float:
+        with self._lock:
+            return max(0.0, self._cooldown_until - time.time())
+
+    def wait_for_cooldown(self, stop_flag: threading.Event) -> bool:
+        """Block until the cool-down expires. Returns False if stopped while waiting."""
+        remaining = self.cooldown_remaining()
+        if remaining > 0:
+            return not stop_flag.wait(remaining)
+        return not stop_flag.is_set()
+
+    def snapshot(self) -> Dict:
+        """Current controller state and counters, for logging and metrics."""
+        with self._lock:
+            elapsed_hours = max((time.time() - self._started_at) / 3600, 1e-9)
+            return {
+                'concurrency': self._concurrency,
+                'delay_scale': round(self._delay_scale, 2),
+                'cooldown_remaining': round(max(0.0, self._cooldown_until - time.time()), 1),
+                'consecutive_blocks': self._consecutive_blocks,
+                'last_signal': self._last_signal,
+                'items_per_hour': round(self._counters['items'] / elapsed_hours, 1),
+                **self._counters,
+            }
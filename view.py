@@ -54,6 +54,21 @@ class ScraperView(ctk.CTk):
         self.page_limit_entry.grid(row=0, column=3, padx=5)
         self.page_limit_entry.insert(0, "100")
 
+        # Listing-only mode: save listing fields without opening each ad
+        self.listing_only_checkbox = ctk.CTkCheckBox(self.limits_frame, text="Listing fields only")
+        self.listing_only_checkbox.grid(row=1, column=0, columnspan=4, padx=5, pady=(5, 0), sticky="w")
+
+        # Profiling: percentage of ads to trace (0 = off), optionally under cProfile
+        self.profile_label = ctk.CTkLabel(self.limits_frame, text="Profile % of ads:")
+        self.profile_label.grid(row=2, column=0, padx=5, pady=(5, 0))
+
+        self.profile_entry = ctk.CTkEntry(self.limits_frame, width=100)
+        self.profile_entry.grid(row=2, column=1, padx=5, pady=(5, 0))
+        self.profile_entry.insert(0, "0")
+
+        self.cprofile_checkbox = ctk.CTkCheckBox(self.limits_frame, text="cProfile")
+        self.cprofile_checkbox.grid(row=2, column=2, padx=5, pady=(5, 0), sticky="w")
+
         # Log Window
         self.log_frame = ctk.CTkFrame(self)
         self.log_frame.grid(row=6, column=0, padx=10, pady=5, sticky="nsew")
@@ -68,19 +83,32 @@ class ScraperView(ctk.CTk):
         self.progress_bar.grid(row=7, column=0, padx=10, pady=10, sticky="ew")
         self.progress_bar.set(0)
 
+        # Counters
+        self.counters_label = ctk.CTkLabel(self, text="Links found: 0 | Items saved: 0")
+        self.counters_label.grid(row=8, column=0, padx=10)
+
         # Control Buttons
         self.button_frame = ctk.CTkFrame(self)
-        self.button_frame.grid(row=8, column=0, padx=10, pady=10)
+        self.button_frame.grid(row=9, column=0, padx=10, pady=10)
 
         self.start_button = ctk.CTkButton(self.button_frame, text="Start Parsing", width=120)
         self.start_button.grid(row=0, column=0, padx=5)
 
+        self.pause_button = ctk.CTkButton(self.button_frame, text="Pause", width=120, state="disabled")
+        self.pause_button.grid(row=0, column=1, padx=5)
+
         self.stop_button = ctk.CTkButton(self.button_frame, text="Stop Parsing", width=120, state="disabled")
-        self.stop_button.grid(row=0, column=1, padx=5)
+        self.stop_button.grid(row=0, column=2, padx=5)
 
     def update_progress(self, value: float):
         self.progress_bar.set(value)
 
+    def update_counters(self, links_found: int, items_saved: int):
+        self.counters_label.configure(text=f"Links found: {links_found} | Items saved: {items_saved}")
+
+    def set_paused(self, is_paused: bool):
+        self.pause_button.configure(text="Resume" if is_paused else "Pause")
+
     def add_log(self, message: str):
         self.log_text.insert('end', message + '\n')
         self.log_text.see('end')
@@ -95,8 +123,13 @@ class ScraperView(ctk.CTk):
         self.path_button.configure(state=state)
         self.limit_entry.configure(state=state)
         self.page_limit_entry.configure(state=state)  # Added this line
+        self.listing_only_checkbox.configure(state=state)
+        self.profile_entry.configure(state=state)
+        self.cprofile_checkbox.configure(state=state)
         self.start_button.configure(state=state)
+        self.pause_button.configure(state=reverse_state)
         self.stop_button.configure(state=reverse_state)
+        self.set_paused(False)
 
     def on_closing(self):
         self.quit()
\ No newline at end of file